@@ -28,6 +28,7 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+import anyio
 from dotenv import load_dotenv
 
 from mcp.server.fastmcp import Context, FastMCP
@@ -116,7 +117,10 @@ async def perform_health_checks(context: ArchonContext):
         all_critical_ready = context.health_status["api_service"]
 
         context.health_status["status"] = "healthy" if all_critical_ready else "degraded"
-        context.health_status["last_health_check"] = datetime.now().isoformat()
+        # The client may serve a cached result, so report when it was actually probed
+        context.health_status["last_health_check"] = service_health.get(
+            "checked_at", datetime.now().isoformat()
+        )
 
         if not all_critical_ready:
             logger.warning(f"Health check failed: {context.health_status}")
@@ -498,6 +502,21 @@ except Exception as e:
     raise
 
 
+async def serve_streamable_http():
+    """
+    Run the streamable HTTP server and close shared clients when the process shuts down.
+
+    The lifespan is entered once per session, so process-wide resources are released here.
+    """
+    try:
+        await mcp.run_streamable_http_async()
+    finally:
+        try:
+            await get_mcp_service_client().close()
+        except Exception as e:
+            logger.warning(f"Error closing service client: {e}")
+
+
 def main():
     """Main entry point for the MCP server."""
     try:
@@ -511,7 +530,7 @@ def main():
         mcp_logger.info("🔥 Logfire initialized for MCP server")
         mcp_logger.info(f"🌟 Starting MCP server - host={server_host}, port={server_port}")
 
-        mcp.run(transport="streamable-http")
+        anyio.run(serve_streamable_http)
 
     except Exception as e:
         mcp_logger.error(f"💥 Fatal error in main - error={str(e)}, error_type={type(e).__name__}")
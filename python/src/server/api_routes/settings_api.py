@@ -7,6 +7,7 @@ Handles:
 - Settings storage and retrieval
 """
 
+import asyncio
 from datetime import datetime
 from typing import Any
 
@@ -47,11 +48,7 @@ async def list_credentials(category: str | None = None):
     """List all credentials and their categories."""
     try:
         logfire.info(f"Listing credentials | category={category}")
-        credentials = await credential_service.list_all_credentials()
-
-        if category:
-            # Filter by category
-            credentials = [cred for cred in credentials if cred.category == category]
+        credentials = await credential_service.list_all_credentials(category=category)
 
         result_count = len(credentials)
         logfire.info(
@@ -201,8 +198,7 @@ async def update_credential(key: str, request: dict[str, Any]):
             description = request.description
 
         # Get existing credential to preserve metadata if not provided
-        existing_creds = await credential_service.list_all_credentials()
-        existing = next((c for c in existing_creds if c.key == key), None)
+        existing = await credential_service.get_credential_metadata(key)
 
         if existing is None:
             # If credential doesn't exist, create it
@@ -211,11 +207,11 @@ async def update_credential(key: str, request: dict[str, Any]):
         else:
             # Preserve existing values if not provided
             if is_encrypted is None:
-                is_encrypted = existing.is_encrypted
+                is_encrypted = existing["is_encrypted"]
             if category is None:
-                category = existing.category
+                category = existing["category"]
             if description is None:
-                description = existing.description
+                description = existing["description"]
             logfire.info(f"Updating existing credential | key={key} | category={category}")
 
         success = await credential_service.set_credential(
@@ -283,36 +279,21 @@ async def database_metrics():
         logfire.info("Getting database metrics")
         supabase_client = get_supabase_client()
 
-        # Get various table counts
-        tables_info = {}
-
-        # Get projects count
-        projects_response = (
-            supabase_client.table("archon_projects").select("id", count="exact").execute()
-        )
-        tables_info["projects"] = (
-            projects_response.count if projects_response.count is not None else 0
-        )
-
-        # Get tasks count
-        tasks_response = supabase_client.table("archon_tasks").select("id", count="exact").execute()
-        tables_info["tasks"] = tasks_response.count if tasks_response.count is not None else 0
+        def count_rows(table: str) -> int:
+            response = supabase_client.table(table).select("id", count="exact", head=True).execute()
+            return response.count if response.count is not None else 0
 
-        # Get crawled pages count
-        pages_response = (
-            supabase_client.table("archon_crawled_pages").select("id", count="exact").execute()
-        )
-        tables_info["crawled_pages"] = (
-            pages_response.count if pages_response.count is not None else 0
-        )
-
-        # Get settings count
-        settings_response = (
-            supabase_client.table("archon_settings").select("id", count="exact").execute()
-        )
-        tables_info["settings"] = (
-            settings_response.count if settings_response.count is not None else 0
+        # Count the tables concurrently - each count is an independent blocking request
+        counted_tables = {
+            "projects": "archon_projects",
+            "tasks": "archon_tasks",
+            "crawled_pages": "archon_crawled_pages",
+            "settings": "archon_settings",
+        }
+        counts = await asyncio.gather(
+            *(asyncio.to_thread(count_rows, table) for table in counted_tables.values())
         )
+        tables_info = dict(zip(counted_tables, counts, strict=True))
 
         total_records = sum(tables_info.values())
         logfire.info(
@@ -15,6 +15,7 @@ import asyncio
 import logging
 import os
 from contextlib import asynccontextmanager
+from datetime import datetime
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
@@ -187,19 +188,20 @@ app.add_middleware(
 )
 
 
+# Access logger muted for health check requests
+uvicorn_access_logger = logging.getLogger("uvicorn.access")
+
+
 # Add middleware to skip logging for health checks
 @app.middleware("http")
 async def skip_health_check_logs(request, call_next):
     # Skip logging for health check endpoints
     if request.url.path in ["/health", "/api/health"]:
         # Temporarily suppress the log
-        import logging
-
-        logger = logging.getLogger("uvicorn.access")
-        old_level = logger.level
-        logger.setLevel(logging.ERROR)
+        old_level = uvicorn_access_logger.level
+        uvicorn_access_logger.setLevel(logging.ERROR)
         response = await call_next(request)
-        logger.setLevel(old_level)
+        uvicorn_access_logger.setLevel(old_level)
         return response
     return await call_next(request)
 
@@ -234,8 +236,6 @@ async def root():
 @app.get("/health")
 async def health_check():
     """Health check endpoint that indicates true readiness including credential loading."""
-    from datetime import datetime
-
     # Check if initialization is complete
     if not _initialization_complete:
         return {
@@ -24,7 +24,21 @@ from ..config.logfire_config import get_logger
 logger = get_logger(__name__)
 
 
-@dataclass
+# archon_settings columns read by the service (skips id and timestamps)
+SETTINGS_COLUMNS = "key, value, encrypted_value, is_encrypted, category, description"
+
+# Categories read on hot paths whose get_credentials_by_category results are cached
+CACHED_CATEGORIES = frozenset({"rag_strategy"})
+
+# Credential key holding the API key for each supported provider
+PROVIDER_API_KEY_NAMES: dict[str, str | None] = {
+    "openai": "OPENAI_API_KEY",
+    "google": "GOOGLE_API_KEY",
+    "ollama": None,  # No API key needed
+}
+
+
+@dataclass(slots=True)
 class CredentialItem:
     """Represents a credential/setting item."""
 
@@ -41,11 +55,14 @@ class CredentialService:
 
     def __init__(self):
         self._supabase: Client | None = None
+        self._fernet: Fernet | None = None
         self._cache: dict[str, Any] = {}
         self._cache_initialized = False
-        self._rag_settings_cache: dict[str, Any] | None = None
-        self._rag_cache_timestamp: float | None = None
-        self._rag_cache_ttl = 300  # 5 minutes TTL for RAG settings cache
+        # Decrypted values keyed by credential key, stored with the ciphertext they came from
+        self._decrypted_cache: dict[str, tuple[str, str]] = {}
+        # Results of get_credentials_by_category for CACHED_CATEGORIES with their fetch timestamp
+        self._category_cache: dict[str, tuple[dict[str, Any], float]] = {}
+        self._category_cache_ttl = 300  # 5 minutes TTL for category settings cache
 
     def _get_supabase_client(self) -> Client:
         """
@@ -94,13 +111,19 @@ class CredentialService:
         key = base64.urlsafe_b64encode(kdf.derive(service_key.encode()))
         return key
 
+    def _get_fernet(self) -> Fernet:
+        """Get the Fernet cipher, deriving the encryption key only once."""
+        if self._fernet is None:
+            self._fernet = Fernet(self._get_encryption_key())
+        return self._fernet
+
     def _encrypt_value(self, value: str) -> str:
         """Encrypt a sensitive value using Fernet encryption."""
         if not value:
             return ""
 
         try:
-            fernet = Fernet(self._get_encryption_key())
+            fernet = self._get_fernet()
             encrypted_bytes = fernet.encrypt(value.encode("utf-8"))
             return base64.urlsafe_b64encode(encrypted_bytes).decode("utf-8")
         except Exception as e:
@@ -113,7 +136,7 @@ class CredentialService:
             return ""
 
         try:
-            fernet = Fernet(self._get_encryption_key())
+            fernet = self._get_fernet()
             encrypted_bytes = base64.urlsafe_b64decode(encrypted_value.encode("utf-8"))
             decrypted_bytes = fernet.decrypt(encrypted_bytes)
             return decrypted_bytes.decode("utf-8")
@@ -127,7 +150,7 @@ class CredentialService:
             supabase = self._get_supabase_client()
 
             # Fetch all credentials
-            result = supabase.table("archon_settings").select("*").execute()
+            result = supabase.table("archon_settings").select(SETTINGS_COLUMNS).execute()
 
             credentials = {}
             for item in result.data:
@@ -147,6 +170,8 @@ class CredentialService:
 
             self._cache = credentials
             self._cache_initialized = True
+            self._decrypted_cache.clear()
+            self._category_cache.clear()
             logger.info(f"Loaded {len(credentials)} credentials from database")
 
             return credentials
@@ -166,8 +191,13 @@ class CredentialService:
         if isinstance(value, dict) and value.get("is_encrypted") and decrypt:
             encrypted_value = value.get("encrypted_value")
             if encrypted_value:
+                cached = self._decrypted_cache.get(key)
+                if cached is not None and cached[0] == encrypted_value:
+                    return cached[1]
                 try:
-                    return self._decrypt_value(encrypted_value)
+                    decrypted_value = self._decrypt_value(encrypted_value)
+                    self._decrypted_cache[key] = (encrypted_value, decrypted_value)
+                    return decrypted_value
                 except Exception as e:
                     logger.error(f"Failed to decrypt credential {key}: {e}")
                     return default
@@ -185,6 +215,23 @@ class CredentialService:
 
         return None
 
+    async def get_credential_metadata(self, key: str) -> dict[str, Any] | None:
+        """Get the stored metadata (is_encrypted, category, description) for a single credential."""
+        try:
+            supabase = self._get_supabase_client()
+            result = (
+                supabase.table("archon_settings")
+                .select("is_encrypted, category, description")
+                .eq("key", key)
+                .limit(1)
+                .execute()
+            )
+            return result.data[0] if result.data else None
+
+        except Exception as e:
+            logger.error(f"Error getting metadata for credential {key}: {e}")
+            raise
+
     async def set_credential(
         self,
         key: str,
@@ -226,6 +273,9 @@ class CredentialService:
                 # Update cache with plain value
                 self._cache[key] = value
 
+            # Drop any decrypted copy of the previous value
+            self._decrypted_cache.pop(key, None)
+
             # Upsert to database with proper conflict handling
             # Since we validate service key at startup, permission errors here indicate actual database issues
             supabase.table("archon_settings").upsert(
@@ -233,11 +283,9 @@ class CredentialService:
                 on_conflict="key",  # Specify the unique column for conflict resolution
             ).execute()
 
-            # Invalidate RAG settings cache if this is a rag_strategy setting
-            if category == "rag_strategy":
-                self._rag_settings_cache = None
-                self._rag_cache_timestamp = None
-                logger.debug(f"Invalidated RAG settings cache due to update of {key}")
+            # Invalidate category caches - the key may also have moved between categories
+            self._category_cache.clear()
+            logger.debug(f"Invalidated category settings cache due to update of {key}")
 
             logger.info(
                 f"Successfully {'encrypted and ' if is_encrypted else ''}stored credential: {key}"
@@ -259,13 +307,13 @@ class CredentialService:
             # Remove from cache
             if key in self._cache:
                 del self._cache[key]
+            self._decrypted_cache.pop(key, None)
 
-            # Invalidate RAG settings cache if this was a rag_strategy setting
-            # We check the cache to see if the deleted key was in rag_strategy category
-            if self._rag_settings_cache is not None and key in self._rag_settings_cache:
-                self._rag_settings_cache = None
-                self._rag_cache_timestamp = None
-                logger.debug(f"Invalidated RAG settings cache due to deletion of {key}")
+            # Invalidate category caches that contained the deleted key
+            for category, (credentials, _) in list(self._category_cache.items()):
+                if key in credentials:
+                    del self._category_cache[category]
+                    logger.debug(f"Invalidated {category} settings cache due to deletion of {key}")
 
             logger.info(f"Successfully deleted credential: {key}")
             return True
@@ -279,23 +327,20 @@ class CredentialService:
         if not self._cache_initialized:
             await self.load_all_credentials()
 
-        # Special caching for rag_strategy category to reduce database calls
-        if category == "rag_strategy":
-            current_time = time.time()
-
-            # Check if we have valid cached data
-            if (
-                self._rag_settings_cache is not None
-                and self._rag_cache_timestamp is not None
-                and current_time - self._rag_cache_timestamp < self._rag_cache_ttl
-            ):
-                logger.debug("Using cached RAG settings")
-                return self._rag_settings_cache
+        # Serve hot-path categories from the cache to reduce database calls
+        if category in CACHED_CATEGORIES:
+            cached = self._category_cache.get(category)
+            if cached is not None and time.time() - cached[1] < self._category_cache_ttl:
+                logger.debug(f"Using cached {category} settings")
+                return cached[0]
 
         try:
             supabase = self._get_supabase_client()
             result = (
-                supabase.table("archon_settings").select("*").eq("category", category).execute()
+                supabase.table("archon_settings")
+                .select(SETTINGS_COLUMNS)
+                .eq("category", category)
+                .execute()
             )
 
             credentials = {}
@@ -310,11 +355,9 @@ class CredentialService:
                 else:
                     credentials[key] = item["value"]
 
-            # Cache rag_strategy results
-            if category == "rag_strategy":
-                self._rag_settings_cache = credentials
-                self._rag_cache_timestamp = time.time()
-                logger.debug(f"Cached RAG settings with {len(credentials)} items")
+            if category in CACHED_CATEGORIES:
+                self._category_cache[category] = (credentials, time.time())
+                logger.debug(f"Cached {category} settings with {len(credentials)} items")
 
             return credentials
 
@@ -322,11 +365,19 @@ class CredentialService:
             logger.error(f"Error getting credentials for category {category}: {e}")
             return {}
 
-    async def list_all_credentials(self) -> list[CredentialItem]:
-        """Get all credentials as a list of CredentialItem objects (for Settings UI)."""
+    async def list_all_credentials(self, category: str | None = None) -> list[CredentialItem]:
+        """
+        Get all credentials as a list of CredentialItem objects (for Settings UI).
+
+        Args:
+            category: Only return credentials in this category, filtered by the database
+        """
         try:
             supabase = self._get_supabase_client()
-            result = supabase.table("archon_settings").select("*").execute()
+            query = supabase.table("archon_settings").select(SETTINGS_COLUMNS)
+            if category:
+                query = query.eq("category", category)
+            result = query.execute()
 
             credentials = []
             for item in result.data:
@@ -441,13 +492,7 @@ class CredentialService:
 
     async def _get_provider_api_key(self, provider: str) -> str | None:
         """Get API key for a specific provider."""
-        key_mapping = {
-            "openai": "OPENAI_API_KEY",
-            "google": "GOOGLE_API_KEY",
-            "ollama": None,  # No API key needed
-        }
-
-        key_name = key_mapping.get(provider)
+        key_name = PROVIDER_API_KEY_NAMES.get(provider)
         if key_name:
             return await self.get_credential(key_name)
         return "ollama" if provider == "ollama" else None
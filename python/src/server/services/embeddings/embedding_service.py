@@ -6,6 +6,7 @@ Handles all OpenAI embedding operations with proper rate limiting and error hand
 
 import asyncio
 import os
+import random
 from dataclasses import dataclass, field
 from typing import Any
 
@@ -23,7 +24,7 @@ from .embedding_exceptions import (
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class EmbeddingBatchResult:
     """Result of batch embedding creation with success/failure tracking."""
 
@@ -67,6 +68,29 @@ class EmbeddingBatchResult:
 # Provider-aware client factory
 get_openai_client = get_llm_client
 
+# Rate limit retry delay bounds in seconds
+BASE_RETRY_DELAY = 1.0
+MAX_RETRY_DELAY = 30.0
+
+
+def _get_retry_delay(error: openai.RateLimitError, previous_delay: float) -> float:
+    """
+    Get the delay before retrying a rate limited request.
+
+    Honors the provider's Retry-After hint when present, otherwise uses decorrelated
+    jitter so concurrent batches don't retry in lockstep.
+    """
+    headers = getattr(error.response, "headers", None) or {}
+    for header, scale in (("retry-after-ms", 0.001), ("retry-after", 1.0)):
+        value = headers.get(header)
+        if isinstance(value, str):
+            try:
+                return min(MAX_RETRY_DELAY, max(0.0, float(value) * scale))
+            except ValueError:
+                continue  # HTTP-date form, fall back to jitter
+
+    return min(MAX_RETRY_DELAY, random.uniform(BASE_RETRY_DELAY, previous_delay * 3))
+
 
 async def create_embedding(text: str, provider: str | None = None) -> list[float]:
     """
@@ -194,6 +218,8 @@ async def create_embeddings_batch(
                     batch_size = 100
                     embedding_dimensions = 1536
 
+                # Resolve the model once - it is the same for every batch of this call
+                embedding_model = await get_embedding_model(provider=provider)
                 total_tokens_used = 0
 
                 for i in range(0, len(texts), batch_size):
@@ -209,11 +235,11 @@ async def create_embeddings_batch(
                         async with threading_service.rate_limited_operation(batch_tokens):
                             retry_count = 0
                             max_retries = 3
+                            wait_time = BASE_RETRY_DELAY
 
                             while retry_count < max_retries:
                                 try:
                                     # Create embeddings for this batch
-                                    embedding_model = await get_embedding_model(provider=provider)
                                     response = await client.embeddings.create(
                                         model=embedding_model,
                                         input=batch,
@@ -259,10 +285,10 @@ async def create_embeddings_batch(
                                         # Regular rate limit - retry
                                         retry_count += 1
                                         if retry_count < max_retries:
-                                            wait_time = 2**retry_count
+                                            wait_time = _get_retry_delay(e, wait_time)
                                             search_logger.warning(
                                                 f"Rate limit hit for batch {batch_index}, "
-                                                f"waiting {wait_time}s before retry {retry_count}/{max_retries}"
+                                                f"waiting {wait_time:.1f}s before retry {retry_count}/{max_retries}"
                                             )
                                             await asyncio.sleep(wait_time)
                                         else:
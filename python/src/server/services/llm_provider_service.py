@@ -5,6 +5,7 @@ Provides a unified interface for creating OpenAI-compatible clients for differen
 Supports OpenAI, Ollama, and Google Gemini.
 """
 
+import asyncio
 import time
 from contextlib import asynccontextmanager
 from typing import Any
@@ -16,6 +17,13 @@ from .credential_service import credential_service
 
 logger = get_logger(__name__)
 
+# Default embedding model per provider when no EMBEDDING_MODEL is configured
+DEFAULT_EMBEDDING_MODELS = {
+    "openai": "text-embedding-3-small",
+    "ollama": "nomic-embed-text",
+    "google": "text-embedding-004",
+}
+
 # Settings cache with TTL
 _settings_cache: dict[str, tuple[Any, float]] = {}
 _CACHE_TTL_SECONDS = 300  # 5 minutes
@@ -38,6 +46,32 @@ def _set_cached_settings(key: str, value: Any) -> None:
     _settings_cache[key] = (value, time.time())
 
 
+# Client cache keyed by (provider, api_key, base_url) so HTTP connection pools are reused.
+# Clients are bound to the event loop that created them. Evicted clients are not closed
+# because another task may still be using them; they are released once unreferenced.
+_CLIENT_CACHE_MAX_SIZE = 4
+_client_cache: dict[
+    tuple[str, str | None, str | None], tuple[openai.AsyncOpenAI, asyncio.AbstractEventLoop]
+] = {}
+
+
+def _get_cached_client(key: tuple[str, str | None, str | None]) -> openai.AsyncOpenAI | None:
+    """Get a cached client if it was created on the running event loop."""
+    cached = _client_cache.get(key)
+    if cached is not None and cached[1] is asyncio.get_running_loop():
+        return cached[0]
+    return None
+
+
+def _set_cached_client(key: tuple[str, str | None, str | None], client: openai.AsyncOpenAI) -> None:
+    """Cache a client, evicting the least recently used entries beyond the size limit."""
+    # Re-insert so the most recently used entry is last
+    _client_cache.pop(key, None)
+    _client_cache[key] = (client, asyncio.get_running_loop())
+    while len(_client_cache) > _CLIENT_CACHE_MAX_SIZE:
+        del _client_cache[next(iter(_client_cache))]
+
+
 @asynccontextmanager
 async def get_llm_client(provider: str | None = None, use_embedding_provider: bool = False):
     """
@@ -91,9 +125,13 @@ async def get_llm_client(provider: str | None = None, use_embedding_provider: bo
             api_key = provider_config["api_key"]
             base_url = provider_config["base_url"]
 
-        logger.info(f"Creating LLM client for provider: {provider_name}")
+        client_key = (provider_name, api_key, base_url)
+        client = _get_cached_client(client_key)
+
+        if client is not None:
+            logger.debug(f"Reusing cached LLM client for provider: {provider_name}")
 
-        if provider_name == "openai":
+        elif provider_name == "openai":
             if not api_key:
                 raise ValueError("OpenAI API key not found")
 
@@ -121,6 +159,8 @@ async def get_llm_client(provider: str | None = None, use_embedding_provider: bo
         else:
             raise ValueError(f"Unsupported LLM provider: {provider_name}")
 
+        _set_cached_client(client_key, client)
+
         yield client
 
     except Exception as e:
@@ -169,18 +209,8 @@ async def get_embedding_model(provider: str | None = None) -> str:
         if custom_model:
             return custom_model
 
-        # Return provider-specific defaults
-        if provider_name == "openai":
-            return "text-embedding-3-small"
-        elif provider_name == "ollama":
-            # Ollama default embedding model
-            return "nomic-embed-text"
-        elif provider_name == "google":
-            # Google's embedding model
-            return "text-embedding-004"
-        else:
-            # Fallback to OpenAI's model
-            return "text-embedding-3-small"
+        # Return provider-specific defaults, falling back to OpenAI's model
+        return DEFAULT_EMBEDDING_MODELS.get(provider_name, "text-embedding-3-small")
 
     except Exception as e:
         logger.error(f"Error getting embedding model: {e}")
@@ -5,7 +5,9 @@ This module provides HTTP clients for the MCP service to communicate with
 other services (API and Agents) instead of importing their modules directly.
 """
 
+import time
 import uuid
+from datetime import datetime
 from typing import Any
 from urllib.parse import urljoin
 
@@ -14,6 +16,9 @@ import httpx
 from ..config.logfire_config import mcp_logger
 from ..config.service_discovery import get_agents_url, get_api_url
 
+# How long a health check result is reused before the services are probed again
+HEALTH_CHECK_TTL_SECONDS = 5.0
+
 
 class MCPServiceClient:
     """
@@ -25,21 +30,35 @@ class MCPServiceClient:
         self.api_url = get_api_url()
         self.agents_url = get_agents_url()
         self.service_auth = "mcp-service-key"  # In production, use proper key management
+        self._base_headers = {
+            "X-Service-Auth": self.service_auth,
+            "Content-Type": "application/json",
+        }
         self.timeout = httpx.Timeout(
             connect=5.0,
             read=300.0,  # 5 minutes for long operations like crawling
             write=30.0,
             pool=5.0,
         )
+        # Shared client so keep-alive connections are reused across calls
+        self._client: httpx.AsyncClient | None = None
+        self._health_cache: tuple[dict[str, Any], float] | None = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get or create the shared HTTP client"""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(timeout=self.timeout)
+        return self._client
+
+    async def close(self) -> None:
+        """Close the shared HTTP client and release its connections"""
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+        self._client = None
 
     def _get_headers(self, request_id: str | None = None) -> dict[str, str]:
         """Get common headers for internal requests"""
-        headers = {"X-Service-Auth": self.service_auth, "Content-Type": "application/json"}
-        if request_id:
-            headers["X-Request-ID"] = request_id
-        else:
-            headers["X-Request-ID"] = str(uuid.uuid4())
-        return headers
+        return {**self._base_headers, "X-Request-ID": request_id or str(uuid.uuid4())}
 
     async def crawl_url(self, url: str, options: dict[str, Any] | None = None) -> dict[str, Any]:
         """
@@ -67,20 +86,19 @@ class MCPServiceClient:
         mcp_logger.info(f"Calling API service to crawl {url}")
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(
-                    endpoint, json=request_data, headers=self._get_headers()
-                )
-                response.raise_for_status()
-                result = response.json()
-
-                # Transform API response to MCP expected format
-                return {
-                    "success": result.get("success", False),
-                    "progressId": result.get("progressId"),
-                    "message": result.get("message", "Crawling started"),
-                    "error": None if result.get("success") else {"message": "Crawl failed"},
-                }
+            response = await self._get_client().post(
+                endpoint, json=request_data, headers=self._get_headers()
+            )
+            response.raise_for_status()
+            result = response.json()
+
+            # Transform API response to MCP expected format
+            return {
+                "success": result.get("success", False),
+                "progressId": result.get("progressId"),
+                "message": result.get("message", "Crawling started"),
+                "error": None if result.get("success") else {"message": "Crawl failed"},
+            }
         except httpx.TimeoutException:
             mcp_logger.error(f"Timeout crawling {url}")
             return {
@@ -120,21 +138,20 @@ class MCPServiceClient:
         mcp_logger.info(f"Calling API service to search: {query}")
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                # First, get search results from API service
-                response = await client.post(
-                    endpoint, json=request_data, headers=self._get_headers()
-                )
-                response.raise_for_status()
-                result = response.json()
-
-                # Transform API response to MCP expected format
-                return {
-                    "success": result.get("success", True),
-                    "results": result.get("results", []),
-                    "reranked": False,  # Reranking should be handled by Server's service layer
-                    "error": None,
-                }
+            # First, get search results from API service
+            response = await self._get_client().post(
+                endpoint, json=request_data, headers=self._get_headers()
+            )
+            response.raise_for_status()
+            result = response.json()
+
+            # Transform API response to MCP expected format
+            return {
+                "success": result.get("success", True),
+                "results": result.get("results", []),
+                "reranked": False,  # Reranking should be handled by Server's service layer
+                "error": None,
+            }
 
         except Exception as e:
             mcp_logger.error(f"Error searching: {str(e)}")
@@ -193,32 +210,44 @@ class MCPServiceClient:
         """
         Check health of all dependent services.
 
+        Results are reused for HEALTH_CHECK_TTL_SECONDS; "checked_at" records when
+        the services were actually probed.
+
         Returns:
             Combined health status
         """
+        if (
+            self._health_cache is not None
+            and time.monotonic() - self._health_cache[1] < HEALTH_CHECK_TTL_SECONDS
+        ):
+            return dict(self._health_cache[0])
+
         health_status = {"api_service": False, "agents_service": False}
 
+        client = self._get_client()
+        health_timeout = httpx.Timeout(5.0)
+
         # Check API service
         api_health_url = urljoin(self.api_url, "/api/health")
         try:
-            async with httpx.AsyncClient(timeout=httpx.Timeout(5.0)) as client:
-                mcp_logger.info(f"Checking API service health at: {api_health_url}")
-                response = await client.get(api_health_url)
-                health_status["api_service"] = response.status_code == 200
-                mcp_logger.info(f"API service health check: {response.status_code}")
+            mcp_logger.info(f"Checking API service health at: {api_health_url}")
+            response = await client.get(api_health_url, timeout=health_timeout)
+            health_status["api_service"] = response.status_code == 200
+            mcp_logger.info(f"API service health check: {response.status_code}")
         except Exception as e:
             health_status["api_service"] = False
             mcp_logger.warning(f"API service health check failed: {e}")
 
         # Check Agents service
         try:
-            async with httpx.AsyncClient(timeout=httpx.Timeout(5.0)) as client:
-                response = await client.get(urljoin(self.agents_url, "/health"))
-                health_status["agents_service"] = response.status_code == 200
+            response = await client.get(urljoin(self.agents_url, "/health"), timeout=health_timeout)
+            health_status["agents_service"] = response.status_code == 200
         except Exception:
             pass
 
-        return health_status
+        health_status["checked_at"] = datetime.now().isoformat()
+        self._health_cache = (health_status, time.monotonic())
+        return dict(health_status)
 
 
 # Global client instance
@@ -0,0 +1,64 @@
+"""Unit tests for MCP server lifecycle handling."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+import src.mcp_server.mcp_server as mcp_server
+
+
+@pytest.fixture
+def service_client():
+    """Mock service client shared by all sessions."""
+    client = MagicMock()
+    client.health_check = AsyncMock(return_value={"api_service": True, "agents_service": True})
+    client.close = AsyncMock()
+    with patch.object(mcp_server, "get_mcp_service_client", return_value=client):
+        yield client
+
+
+@pytest.fixture
+def reset_shared_context():
+    """Reset the shared lifespan context before and after the test."""
+    mcp_server._initialization_complete = False
+    mcp_server._shared_context = None
+    yield
+    mcp_server._initialization_complete = False
+    mcp_server._shared_context = None
+
+
+@pytest.mark.asyncio
+async def test_session_lifespan_keeps_service_client_open(service_client, reset_shared_context):
+    """Test that ending the first session does not close the client other sessions share."""
+    with patch.object(mcp_server, "get_session_manager"):
+        async with mcp_server.lifespan(MagicMock()) as context:
+            assert context.service_client is service_client
+
+    service_client.close.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_serve_streamable_http_closes_service_client(service_client):
+    """Test that the service client is closed when the server process shuts down."""
+    with patch.object(
+        mcp_server.mcp, "run_streamable_http_async", AsyncMock(), create=True
+    ) as run_server:
+        await mcp_server.serve_streamable_http()
+
+    run_server.assert_awaited_once()
+    service_client.close.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_serve_streamable_http_closes_service_client_on_error(service_client):
+    """Test that the service client is closed even if the server stops with an error."""
+    with patch.object(
+        mcp_server.mcp,
+        "run_streamable_http_async",
+        AsyncMock(side_effect=RuntimeError("boom")),
+        create=True,
+    ):
+        with pytest.raises(RuntimeError):
+            await mcp_server.serve_streamable_http()
+
+    service_client.close.assert_awaited_once()
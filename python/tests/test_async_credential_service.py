@@ -12,6 +12,7 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from src.server.services.credential_service import (
+    SETTINGS_COLUMNS,
     credential_service,
     get_credential,
     initialize_credentials,
@@ -27,10 +28,14 @@ class TestAsyncCredentialService:
         """Setup clean credential service for each test"""
         # Clear cache and reset state
         credential_service._cache.clear()
+        credential_service._decrypted_cache.clear()
+        credential_service._category_cache.clear()
         credential_service._cache_initialized = False
         yield
         # Cleanup after test
         credential_service._cache.clear()
+        credential_service._decrypted_cache.clear()
+        credential_service._category_cache.clear()
         credential_service._cache_initialized = False
 
     @pytest.fixture
@@ -114,6 +119,42 @@ class TestAsyncCredentialService:
             assert result == "decrypted_value"
             credential_service._decrypt_value.assert_called_once_with("encrypted_test_value")
 
+    @pytest.mark.asyncio
+    async def test_get_credential_decrypted_value_cached(self):
+        """Test that decrypted values are reused until the ciphertext changes"""
+        credential_service._cache = {
+            "SECRET_KEY": {"encrypted_value": "encrypted_v1", "is_encrypted": True}
+        }
+        credential_service._cache_initialized = True
+
+        with patch.object(
+            credential_service, "_decrypt_value", side_effect=lambda v: v.replace("encrypted_", "")
+        ):
+            assert await get_credential("SECRET_KEY") == "v1"
+            assert await get_credential("SECRET_KEY") == "v1"
+            assert credential_service._decrypt_value.call_count == 1
+
+            # Rotated ciphertext must be decrypted again
+            credential_service._cache["SECRET_KEY"] = {
+                "encrypted_value": "encrypted_v2",
+                "is_encrypted": True,
+            }
+            assert await get_credential("SECRET_KEY") == "v2"
+            assert credential_service._decrypt_value.call_count == 2
+
+    def test_encryption_key_derived_once(self):
+        """Test that the Fernet cipher is built once and reused for encrypt/decrypt"""
+        from src.server.services.credential_service import CredentialService
+
+        service = CredentialService()
+        with patch.object(
+            service, "_get_encryption_key", wraps=service._get_encryption_key
+        ) as mock_get_key:
+            encrypted = service._encrypt_value("secret_value")
+            assert service._decrypt_value(encrypted) == "secret_value"
+            assert service._decrypt_value(service._encrypt_value("other")) == "other"
+            assert mock_get_key.call_count == 1
+
     @pytest.mark.asyncio
     async def test_get_credential_cache_not_initialized(self, mock_supabase_client):
         """Test getting credential when cache is not initialized"""
@@ -138,7 +179,7 @@ class TestAsyncCredentialService:
             assert result == "db_value"
 
             # Should have called database to load all credentials
-            mock_table.select.assert_called_with("*")
+            mock_table.select.assert_called_with(SETTINGS_COLUMNS)
             # Should have called execute on the query
             assert mock_table.select().execute.called
 
@@ -156,6 +197,31 @@ class TestAsyncCredentialService:
             result = await credential_service.get_credential("MISSING_KEY", "default_value")
             assert result == "default_value"
 
+    @pytest.mark.asyncio
+    async def test_get_credential_metadata(self, mock_supabase_client):
+        """Test that metadata for a single key is fetched with a narrow query"""
+        mock_client, mock_table = mock_supabase_client
+        query = mock_table.select.return_value.eq.return_value.limit.return_value
+
+        query.execute.return_value = MagicMock(
+            data=[{"is_encrypted": True, "category": "api_keys", "description": "OpenAI key"}]
+        )
+
+        with patch.object(credential_service, "_get_supabase_client", return_value=mock_client):
+            metadata = await credential_service.get_credential_metadata("OPENAI_API_KEY")
+
+            mock_table.select.assert_called_once_with("is_encrypted, category, description")
+            mock_table.select.return_value.eq.assert_called_once_with("key", "OPENAI_API_KEY")
+            mock_table.select.return_value.eq.return_value.limit.assert_called_once_with(1)
+            assert metadata == {
+                "is_encrypted": True,
+                "category": "api_keys",
+                "description": "OpenAI key",
+            }
+
+            query.execute.return_value = MagicMock(data=[])
+            assert await credential_service.get_credential_metadata("MISSING_KEY") is None
+
     @pytest.mark.asyncio
     async def test_set_credential_new(self, mock_supabase_client):
         """Test setting a new credential"""
@@ -252,6 +318,82 @@ class TestAsyncCredentialService:
             assert result["MODEL_CHOICE"] == "gpt-4.1-nano"
             assert result["MAX_TOKENS"] == "1000"
 
+    @pytest.mark.asyncio
+    async def test_get_credentials_by_category_cached_until_update(self, mock_supabase_client):
+        """Test that category results are cached and invalidated by writes"""
+        mock_client, mock_table = mock_supabase_client
+        credential_service._cache_initialized = True
+
+        mock_response = MagicMock()
+        mock_response.data = [
+            {
+                "key": "MODEL_CHOICE",
+                "value": "gpt-4.1-nano",
+                "is_encrypted": False,
+                "description": None,
+            }
+        ]
+        mock_table.select().eq().execute.return_value = mock_response
+        mock_table.select.reset_mock()
+
+        with patch.object(credential_service, "_get_supabase_client", return_value=mock_client):
+            first = await credential_service.get_credentials_by_category("rag_strategy")
+            second = await credential_service.get_credentials_by_category("rag_strategy")
+            assert first == second == {"MODEL_CHOICE": "gpt-4.1-nano"}
+            assert mock_table.select.call_count == 1
+
+            await credential_service.set_credential(
+                "MODEL_CHOICE", "gpt-4.1-mini", category="rag_strategy"
+            )
+            await credential_service.get_credentials_by_category("rag_strategy")
+            assert mock_table.select.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_get_credentials_by_category_only_caches_hot_categories(
+        self, mock_supabase_client
+    ):
+        """Test that categories outside CACHED_CATEGORIES are always read from the database"""
+        mock_client, mock_table = mock_supabase_client
+        credential_service._cache_initialized = True
+
+        mock_response = MagicMock()
+        mock_response.data = [
+            {"key": "CRAWL_BATCH_SIZE", "value": "50", "is_encrypted": False, "description": None}
+        ]
+        mock_table.select().eq().execute.return_value = mock_response
+        mock_table.select.reset_mock()
+
+        with patch.object(credential_service, "_get_supabase_client", return_value=mock_client):
+            await credential_service.get_credentials_by_category("crawling")
+            await credential_service.get_credentials_by_category("crawling")
+
+            assert mock_table.select.call_count == 2
+            assert credential_service._category_cache == {}
+
+    @pytest.mark.asyncio
+    async def test_list_all_credentials_filters_category_in_query(self, mock_supabase_client):
+        """Test that the category filter is applied by the database query"""
+        mock_client, mock_table = mock_supabase_client
+
+        mock_response = MagicMock()
+        mock_response.data = [
+            {
+                "key": "MODEL_CHOICE",
+                "value": "gpt-4.1-nano",
+                "encrypted_value": None,
+                "is_encrypted": False,
+                "category": "rag_strategy",
+                "description": "Model choice",
+            }
+        ]
+        mock_table.select().eq().execute.return_value = mock_response
+
+        with patch.object(credential_service, "_get_supabase_client", return_value=mock_client):
+            credentials = await credential_service.list_all_credentials(category="rag_strategy")
+
+            mock_table.select().eq.assert_called_with("category", "rag_strategy")
+            assert [cred.key for cred in credentials] == ["MODEL_CHOICE"]
+
     @pytest.mark.asyncio
     async def test_get_active_provider_llm(self, mock_supabase_client):
         """Test getting active LLM provider configuration"""
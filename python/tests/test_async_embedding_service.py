@@ -14,7 +14,9 @@ from src.server.services.embeddings.embedding_exceptions import (
     EmbeddingAPIError,
 )
 from src.server.services.embeddings.embedding_service import (
+    MAX_RETRY_DELAY,
     EmbeddingBatchResult,
+    _get_retry_delay,
     create_embedding,
     create_embeddings_batch,
 )
@@ -442,7 +444,7 @@ class TestAsyncEmbeddingService:
                 with patch(
                     "src.server.services.embeddings.embedding_service.get_embedding_model",
                     return_value="text-embedding-3-small",
-                ):
+                ) as mock_get_model:
                     with patch(
                         "src.server.services.embeddings.embedding_service.credential_service"
                     ) as mock_cred:
@@ -459,6 +461,8 @@ class TestAsyncEmbeddingService:
 
                         # Should have made 3 API calls due to batching
                         assert mock_llm_client.embeddings.create.call_count == 3
+                        # Model is resolved once per call, not once per batch
+                        assert mock_get_model.call_count == 1
 
                         # Result should be EmbeddingBatchResult
                         assert isinstance(result, EmbeddingBatchResult)
@@ -467,3 +471,23 @@ class TestAsyncEmbeddingService:
                         assert result.success_count == 5
                         assert len(result.embeddings) == 5
                         assert result.texts_processed == texts
+
+    def test_retry_delay_honors_retry_after(self):
+        """Test that provider Retry-After hints are used and capped"""
+        response = MagicMock()
+        response.headers = {"retry-after-ms": "1500"}
+        error = openai.RateLimitError("Rate limit exceeded", response=response, body=None)
+        assert _get_retry_delay(error, 1.0) == 1.5
+
+        response.headers = {"retry-after": "120"}
+        assert _get_retry_delay(error, 1.0) == MAX_RETRY_DELAY
+
+    def test_retry_delay_uses_decorrelated_jitter(self):
+        """Test that the fallback delay grows from the previous delay within bounds"""
+        response = MagicMock()
+        response.headers = {}
+        error = openai.RateLimitError("Rate limit exceeded", response=response, body=None)
+
+        for previous_delay in (1.0, 4.0, 20.0):
+            delay = _get_retry_delay(error, previous_delay)
+            assert 1.0 <= delay <= min(MAX_RETRY_DELAY, previous_delay * 3)
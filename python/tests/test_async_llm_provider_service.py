@@ -5,6 +5,7 @@ Tests all aspects of the async LLM provider service after sync function removal.
 Covers different providers (OpenAI, Ollama, Google) and error scenarios.
 """
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -39,8 +40,10 @@ class TestAsyncLLMProviderService:
         import src.server.services.llm_provider_service as llm_module
 
         llm_module._settings_cache.clear()
+        llm_module._client_cache.clear()
         yield
         llm_module._settings_cache.clear()
+        llm_module._client_cache.clear()
 
     @pytest.fixture
     def mock_credential_service(self):
@@ -402,6 +405,112 @@ class TestAsyncLLMProviderService:
                 # Should only call get_active_provider once due to caching
                 assert mock_credential_service.get_active_provider.call_count == 1
 
+    @pytest.mark.asyncio
+    async def test_client_reused_for_same_provider_config(
+        self, mock_credential_service, openai_provider_config
+    ):
+        """Test that clients are reused until the provider configuration changes"""
+        mock_credential_service.get_active_provider.return_value = openai_provider_config
+
+        with patch(
+            "src.server.services.llm_provider_service.credential_service", mock_credential_service
+        ):
+            with patch(
+                "src.server.services.llm_provider_service.openai.AsyncOpenAI"
+            ) as mock_openai:
+                mock_openai.side_effect = lambda **kwargs: MagicMock(close=AsyncMock())
+
+                async with get_llm_client() as first_client:
+                    pass
+                async with get_llm_client() as second_client:
+                    pass
+
+                assert first_client is second_client
+                assert mock_openai.call_count == 1
+
+                # A rotated API key must produce a new client
+                import src.server.services.llm_provider_service as llm_module
+
+                llm_module._settings_cache.clear()
+                mock_credential_service.get_active_provider.return_value = {
+                    **openai_provider_config,
+                    "api_key": "rotated-openai-key",
+                }
+
+                async with get_llm_client() as third_client:
+                    pass
+
+                assert third_client is not first_client
+                assert mock_openai.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_rotated_key_does_not_close_client_in_use(
+        self, mock_credential_service, openai_provider_config
+    ):
+        """Test that a rotated API key gets its own client without closing one still in use"""
+        import src.server.services.llm_provider_service as llm_module
+
+        mock_credential_service.get_active_provider.return_value = openai_provider_config
+
+        with patch(
+            "src.server.services.llm_provider_service.credential_service", mock_credential_service
+        ):
+            with patch(
+                "src.server.services.llm_provider_service.openai.AsyncOpenAI"
+            ) as mock_openai:
+                mock_openai.side_effect = lambda **kwargs: MagicMock(close=AsyncMock())
+
+                async with get_llm_client() as old_client:
+                    llm_module._settings_cache.clear()
+                    mock_credential_service.get_active_provider.return_value = {
+                        **openai_provider_config,
+                        "api_key": "rotated-openai-key",
+                    }
+
+                    async with get_llm_client() as new_client:
+                        pass
+
+                    await asyncio.sleep(0)
+                    assert new_client is not old_client
+                    old_client.close.assert_not_called()
+
+                assert set(llm_module._client_cache) == {
+                    ("openai", "test-openai-key", None),
+                    ("openai", "rotated-openai-key", None),
+                }
+
+    @pytest.mark.asyncio
+    async def test_client_cache_is_bounded(self, mock_credential_service):
+        """Test that the client cache evicts the least recently used entries without closing"""
+        import src.server.services.llm_provider_service as llm_module
+
+        max_size = llm_module._CLIENT_CACHE_MAX_SIZE
+
+        with patch(
+            "src.server.services.llm_provider_service.credential_service", mock_credential_service
+        ):
+            with patch(
+                "src.server.services.llm_provider_service.openai.AsyncOpenAI"
+            ) as mock_openai:
+                mock_openai.side_effect = lambda **kwargs: MagicMock(close=AsyncMock())
+
+                clients = []
+                for i in range(max_size + 2):
+                    llm_module._settings_cache.clear()
+                    mock_credential_service.get_active_provider.return_value = {
+                        "provider": "openai",
+                        "api_key": f"key-{i}",
+                        "base_url": None,
+                    }
+                    async with get_llm_client() as client:
+                        clients.append(client)
+
+                assert list(llm_module._client_cache) == [
+                    ("openai", f"key-{i}", None) for i in range(2, max_size + 2)
+                ]
+                for client in clients:
+                    client.close.assert_not_called()
+
     def test_deprecated_functions_removed(self):
         """Test that deprecated sync functions are no longer available"""
         import src.server.services.llm_provider_service as llm_module
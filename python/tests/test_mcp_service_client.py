@@ -0,0 +1,116 @@
+"""
+Tests for the MCP service client
+
+Covers reuse of the shared HTTP client, per-request timeouts for health probes,
+health check caching, and shutdown of the client.
+"""
+
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from src.server.services.mcp_service_client import HEALTH_CHECK_TTL_SECONDS, MCPServiceClient
+
+
+class TestMCPServiceClient:
+    """Test suite for MCPServiceClient HTTP handling"""
+
+    @pytest.fixture
+    def requests(self):
+        """Requests seen by the mock transport"""
+        return []
+
+    @pytest.fixture
+    def created_clients(self):
+        """HTTP clients created by the service client"""
+        return []
+
+    @pytest.fixture
+    def service_client(self, requests, created_clients):
+        """MCPServiceClient whose HTTP clients are backed by a mock transport"""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            if request.url.path.endswith("health"):
+                return httpx.Response(200, json={"status": "healthy"})
+            return httpx.Response(200, json={"success": True, "results": []})
+
+        real_async_client = httpx.AsyncClient
+
+        def make_client(**kwargs):
+            client = real_async_client(transport=httpx.MockTransport(handler), **kwargs)
+            created_clients.append(client)
+            return client
+
+        with patch(
+            "src.server.services.mcp_service_client.httpx.AsyncClient", side_effect=make_client
+        ):
+            yield MCPServiceClient()
+
+    @pytest.mark.asyncio
+    async def test_http_client_reused_across_calls(self, service_client, requests, created_clients):
+        """Test that crawl, search and health checks share one HTTP client"""
+        crawl_result = await service_client.crawl_url("https://example.com")
+        search_result = await service_client.search("query")
+        health = await service_client.health_check()
+
+        assert crawl_result["success"] is True
+        assert search_result["success"] is True
+        assert health["api_service"] is True
+        assert health["agents_service"] is True
+        assert len(requests) == 4
+        assert len(created_clients) == 1
+
+    @pytest.mark.asyncio
+    async def test_health_check_uses_short_timeout(self, service_client, requests):
+        """Test that health probes override the long default timeout with 5 seconds"""
+        await service_client.search("query")
+        await service_client.health_check()
+
+        search_request, *health_requests = requests
+        assert search_request.extensions["timeout"]["read"] == 300.0
+        assert len(health_requests) == 2
+        for request in health_requests:
+            assert request.extensions["timeout"] == {
+                "connect": 5.0,
+                "read": 5.0,
+                "write": 5.0,
+                "pool": 5.0,
+            }
+
+    @pytest.mark.asyncio
+    async def test_health_check_cached_within_ttl(self, service_client, requests):
+        """Test that health results are reused within the TTL and probed again after it"""
+        now = 1000.0
+        with patch(
+            "src.server.services.mcp_service_client.time.monotonic", side_effect=lambda: now
+        ):
+            first = await service_client.health_check()
+            assert len(requests) == 2
+
+            now += HEALTH_CHECK_TTL_SECONDS - 0.1
+            second = await service_client.health_check()
+            assert len(requests) == 2
+            assert second == first
+            assert second["checked_at"] == first["checked_at"]
+
+            # Callers get a copy, so mutating a result does not change the cache
+            second["api_service"] = False
+            assert (await service_client.health_check())["api_service"] is True
+
+            now += 0.2
+            await service_client.health_check()
+            assert len(requests) == 4
+
+    @pytest.mark.asyncio
+    async def test_close_releases_http_client(self, service_client, created_clients):
+        """Test that close shuts the shared client and a later call opens a new one"""
+        await service_client.search("query")
+        await service_client.close()
+
+        assert created_clients[0].is_closed
+
+        await service_client.search("query")
+        assert len(created_clients) == 2
+        assert not created_clients[1].is_closed
@@ -58,3 +58,72 @@ def test_existing_credential_returns_normally(client, mock_supabase_client):
         assert "is_default" not in data
 
 
+def test_update_credential_preserves_existing_metadata(client, mock_supabase_client):
+    """Test that PUT keeps stored metadata without listing every credential."""
+    mock_service = MagicMock()
+    mock_service.get_credential_metadata = AsyncMock(
+        return_value={"is_encrypted": True, "category": "api_keys", "description": "OpenAI key"}
+    )
+    mock_service.set_credential = AsyncMock(return_value=True)
+    mock_service.list_all_credentials = AsyncMock()
+
+    with patch("src.server.api_routes.settings_api.credential_service", mock_service):
+        response = client.put("/api/credentials/OPENAI_API_KEY", json={"value": "sk-new"})
+
+        assert response.status_code == 200
+        mock_service.get_credential_metadata.assert_awaited_once_with("OPENAI_API_KEY")
+        mock_service.list_all_credentials.assert_not_called()
+        mock_service.set_credential.assert_awaited_once_with(
+            key="OPENAI_API_KEY",
+            value="sk-new",
+            is_encrypted=True,
+            category="api_keys",
+            description="OpenAI key",
+        )
+
+
+def test_database_metrics_counts_each_table(client):
+    """Test that database metrics report a count per table."""
+    table_counts = {
+        "archon_projects": 2,
+        "archon_tasks": 5,
+        "archon_crawled_pages": 40,
+        "archon_settings": None,
+    }
+
+    mock_tables = {}
+
+    def table(name):
+        mock_table = MagicMock()
+        mock_table.select.return_value.execute.return_value.count = table_counts[name]
+        mock_tables[name] = mock_table
+        return mock_table
+
+    mock_client = MagicMock()
+    mock_client.table.side_effect = table
+
+    with patch("src.server.api_routes.settings_api.get_supabase_client", return_value=mock_client):
+        response = client.get("/api/database/metrics")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["tables"] == {"projects": 2, "tasks": 5, "crawled_pages": 40, "settings": 0}
+        assert data["total_records"] == 47
+
+        # Only the counts are requested, no rows are transferred
+        assert set(mock_tables) == set(table_counts)
+        for mock_table in mock_tables.values():
+            mock_table.select.assert_called_once_with("id", count="exact", head=True)
+
+
+def test_list_credentials_filters_category_in_service(client):
+    """Test that the category filter is passed down instead of applied in memory."""
+    mock_service = MagicMock()
+    mock_service.list_all_credentials = AsyncMock(return_value=[])
+
+    with patch("src.server.api_routes.settings_api.credential_service", mock_service):
+        response = client.get("/api/credentials", params={"category": "rag_strategy"})
+
+        assert response.status_code == 200
+        assert response.json() == []
+        mock_service.list_all_credentials.assert_awaited_once_with(category="rag_strategy")